@@ -1,10 +1,9 @@
 """Async threadpool-based JSON filesystem."""
 from __future__ import annotations
-from asyncio import get_event_loop, gather, AbstractEventLoop
+from asyncio import Future, get_running_loop
 from concurrent.futures import ThreadPoolExecutor
-from functools import partial
 from pathlib import PurePosixPath
-from typing import List, Optional
+from typing import AsyncGenerator, List, Optional
 
 from .base import (
     default_parse_json,
@@ -16,7 +15,7 @@ from .base import (
     DirectoryEntry,
 )
 
-from .sync_filesystem import SyncFilesystem
+from .sync_filesystem import SyncFilesystem, _iter_json_files, _read_json_file
 
 
 class AsyncFilesystem(AsyncFilesystemLike):
@@ -50,10 +49,6 @@ class AsyncFilesystem(AsyncFilesystemLike):
         self._sync_filesystem = sync_filesystem
         self._executor = executor
 
-    @property
-    def _loop(self) -> AbstractEventLoop:
-        return get_event_loop()
-
     @property
     def sync(self) -> SyncFilesystem:
         """Get the underlying synchronous filesystem interface."""
@@ -61,19 +56,19 @@ class AsyncFilesystem(AsyncFilesystemLike):
 
     async def ensure_dir(self, path: PurePosixPath) -> PurePosixPath:
         """Ensure a directory at `path` exists, creating it if it doesn't."""
-        task = partial(self.sync.ensure_dir, path=path)
-        await self._loop.run_in_executor(self._executor, task)
+        loop = get_running_loop()
+        await loop.run_in_executor(self._executor, self.sync.ensure_dir, path)
         return path
 
     async def read_dir(self, path: PurePosixPath) -> List[str]:
         """Get the stem names of all JSON files in the directory."""
-        task = partial(self.sync.read_dir, path=path)
-        return await self._loop.run_in_executor(self._executor, task)
+        loop = get_running_loop()
+        return await loop.run_in_executor(self._executor, self.sync.read_dir, path)
 
     async def file_exists(self, path: PurePosixPath) -> bool:
         """Return True if `{path}.json` is a file."""
-        task = partial(self.sync.file_exists, path=path)
-        return await self._loop.run_in_executor(self._executor, task)
+        loop = get_running_loop()
+        return await loop.run_in_executor(self._executor, self.sync.file_exists, path)
 
     async def read_json(
         self,
@@ -81,11 +76,11 @@ class AsyncFilesystem(AsyncFilesystemLike):
         parse_json: JSONParser[ResultT] = default_parse_json,
     ) -> ResultT:
         """Read and parse a single JSON file."""
-        task: partial[ResultT] = partial(
-            self.sync.read_json, path=path, parse_json=parse_json
-        )
+        loop = get_running_loop()
 
-        return await self._loop.run_in_executor(self._executor, task)
+        return await loop.run_in_executor(
+            self._executor, self.sync.read_json, path, parse_json
+        )
 
     async def read_json_dir(
         self,
@@ -93,21 +88,57 @@ class AsyncFilesystem(AsyncFilesystemLike):
         parse_json: JSONParser[ResultT] = default_parse_json,
         ignore_errors: bool = False,
     ) -> List[DirectoryEntry[ResultT]]:
-        """Read and parse all JSON files in a directory concurrently."""
+        """Read and parse all JSON files in a directory in one worker task."""
+        loop = get_running_loop()
+
+        return await loop.run_in_executor(
+            self._executor, self.sync.read_json_dir, path, parse_json, ignore_errors
+        )
+
+    async def iter_json_dir(
+        self,
+        path: PurePosixPath,
+        parse_json: JSONParser[ResultT] = default_parse_json,
+        ignore_errors: bool = False,
+    ) -> AsyncGenerator[DirectoryEntry[ResultT], None]:
+        """Read and parse all JSON files in a directory, yielding each as read."""
+        loop = get_running_loop()
+        json_files = await loop.run_in_executor(
+            self._executor, list, _iter_json_files(path)
+        )
+
+        def read_file(index: int) -> Future[ResultT]:
+            return loop.run_in_executor(
+                self._executor, _read_json_file, json_files[index][1], parse_json
+            )
+
+        if not json_files:
+            return
 
-        async def _read_entry(child: str) -> DirectoryEntry[ResultT]:
-            child_path = PurePosixPath(path / child)
-            child_contents = await self.read_json(child_path, parse_json)
-            return DirectoryEntry(path=child_path, contents=child_contents)
+        pending = read_file(0)
 
-        children = await self.read_dir(path)
-        tasks = [_read_entry(child) for child in children]
-        entries = await gather(*tasks, return_exceptions=ignore_errors)
+        try:
+            for index, (key, _) in enumerate(json_files):
+                current = pending
 
-        if ignore_errors:
-            entries = [entry for entry in entries if not isinstance(entry, Exception)]
+                # start reading the next file before this entry is consumed
+                if index + 1 < len(json_files):
+                    pending = read_file(index + 1)
 
-        return entries
+                try:
+                    child_contents = await current
+                except Exception as error:
+                    if not ignore_errors:
+                        raise error
+
+                    continue
+
+                yield DirectoryEntry(path=path / key, contents=child_contents)
+        finally:
+            # drop a prefetched read that is still pending when the generator
+            # is closed early, without leaving its exception unretrieved
+            if not pending.cancel() and not pending.cancelled():
+                pending.exception()
 
     async def write_json(
         self,
@@ -116,20 +147,20 @@ class AsyncFilesystem(AsyncFilesystemLike):
         encode_json: JSONEncoder[ResultT] = default_encode_json,
     ) -> None:
         """Write an object to a JSON file."""
-        task = partial(
-            self.sync.write_json, path=path, contents=contents, encode_json=encode_json
-        )
+        loop = get_running_loop()
 
-        return await self._loop.run_in_executor(self._executor, task)
+        return await loop.run_in_executor(
+            self._executor, self.sync.write_json, path, contents, encode_json
+        )
 
     async def remove(self, path: PurePosixPath) -> None:
         """Delete a JSON file."""
-        task = partial(self.sync.remove, path=path)
+        loop = get_running_loop()
 
-        return await self._loop.run_in_executor(self._executor, task)
+        return await loop.run_in_executor(self._executor, self.sync.remove, path)
 
     async def remove_dir(self, path: PurePosixPath) -> None:
         """Delete all files in the given directory and the directory."""
-        task = partial(self.sync.remove_dir, path=path)
+        loop = get_running_loop()
 
-        return await self._loop.run_in_executor(self._executor, task)
+        return await loop.run_in_executor(self._executor, self.sync.remove_dir, path)
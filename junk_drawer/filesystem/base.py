@@ -3,7 +3,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from json import loads as json_loads, dumps as json_dumps
 from pathlib import PurePosixPath
-from typing import Any, Callable, Generic, List, TypeVar
+from typing import Any, AsyncIterator, Callable, Generic, List, TypeVar, Union
 
 
 ResultT = TypeVar("ResultT")
@@ -13,22 +13,26 @@ ResultT = TypeVar("ResultT")
 class DirectoryEntry(Generic[ResultT]):
     """Filename and parsed file contents from a full directory read."""
 
+    # declared manually because `dataclass(slots=True)` requires Python 3.10
+    __slots__ = ("path", "contents")
+
     path: PurePosixPath
     contents: ResultT
 
 
-JSONParser = Callable[[str], ResultT]
-JSONEncoder = Callable[[ResultT], str]
+JSONParser = Callable[[bytes], ResultT]
+JSONEncoder = Callable[[ResultT], Union[str, bytes]]
 
 
-def default_parse_json(text: str) -> Any:
-    """Parse a JSON string using builtin `json` module."""
-    return json_loads(text)
+# The builtin `json.loads` accepts UTF-8 encoded bytes as-is, so it is used as
+# the default parser directly rather than through a wrapper function, sparing
+# a Python-level call frame on every file read
+default_parse_json: JSONParser[Any] = json_loads
 
 
-def default_encode_json(obj: Any) -> str:
-    """Encode a value to a JSON string using builtin `json` module."""
-    return json_dumps(obj)
+def default_encode_json(obj: Any) -> bytes:
+    """Encode a value to UTF-8 JSON bytes using builtin `json` module."""
+    return json_dumps(obj).encode()
 
 
 class SyncFilesystemLike(ABC):
@@ -139,9 +143,19 @@ class AsyncFilesystemLike(ABC):
         parse_json: JSONParser[ResultT],
         ignore_errors: bool,
     ) -> List[DirectoryEntry[ResultT]]:
-        """Read and parse all JSON files in a directory concurrently."""
+        """Read and parse all JSON files in a directory."""
         ...
 
+    async def iter_json_dir(
+        self,
+        path: PurePosixPath,
+        parse_json: JSONParser[ResultT],
+        ignore_errors: bool,
+    ) -> AsyncIterator[DirectoryEntry[ResultT]]:
+        """Read and parse all JSON files in a directory, yielding each entry."""
+        for entry in await self.read_json_dir(path, parse_json, ignore_errors):
+            yield entry
+
     @abstractmethod
     async def write_json(
         self,
@@ -1,8 +1,12 @@
 """Synchronous JSON filesystem."""
+import os
+from contextlib import suppress
 from logging import getLogger
 from pathlib import Path, PurePosixPath
 from shutil import rmtree
-from typing import List, Optional
+from stat import S_IMODE
+from typing import Iterator, List, Tuple, Union
+from uuid import uuid4
 
 from .errors import (
     PathNotFoundError,
@@ -23,9 +27,132 @@ from .base import (
     SyncFilesystemLike,
 )
 
-
 log = getLogger(__name__)
 
+# os.open defaults to text mode on Windows, which would translate newlines
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+_NEW_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def _json_path(path: PurePosixPath) -> str:
+    """Get the file path string for `path` with its suffix replaced by `.json`."""
+    return str(path.with_suffix(".json"))
+
+
+def _write_data(file_path: str, flags: int, data: bytes) -> None:
+    """Open the file at `file_path` with `flags` and write all of `data`."""
+    view = memoryview(data)
+    fd = os.open(file_path, flags, 0o666)
+
+    try:
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _copy_file_owner_and_mode(src_path: str, dst_path: str) -> None:
+    """Give the file at `dst_path` the mode and owner of `src_path`, if any."""
+    try:
+        src_stat = os.stat(src_path)
+    except FileNotFoundError:
+        return
+
+    dst_stat = os.stat(dst_path)
+    src_mode = S_IMODE(src_stat.st_mode)
+    src_owner = (src_stat.st_uid, src_stat.st_gid)
+
+    if S_IMODE(dst_stat.st_mode) != src_mode:
+        os.chmod(dst_path, src_mode)
+
+    if hasattr(os, "chown") and (dst_stat.st_uid, dst_stat.st_gid) != src_owner:
+        # only privileged users may give a file away to another owner
+        with suppress(PermissionError):
+            os.chown(dst_path, src_stat.st_uid, src_stat.st_gid)
+
+
+def _write_file(file_path: str, contents: Union[str, bytes]) -> None:
+    """Write encoded contents to a file, replacing it atomically."""
+    data = contents.encode() if isinstance(contents, str) else contents
+    tmp_path = f"{file_path}.{uuid4().hex}.tmp"
+    replaced = False
+
+    try:
+        _write_data(tmp_path, _NEW_FILE_FLAGS, data)
+        _copy_file_owner_and_mode(file_path, tmp_path)
+
+        try:
+            os.replace(tmp_path, file_path)
+            replaced = True
+        except PermissionError:
+            if os.name != "nt":
+                raise
+
+            # Windows cannot replace a file while a reader has it open, so
+            # fall back to overwriting it in place, without atomicity
+            _write_data(file_path, _WRITE_FLAGS, data)
+    finally:
+        if not replaced:
+            # a failed cleanup must not mask the error that caused it
+            with suppress(OSError):
+                os.unlink(tmp_path)
+
+
+def _read_json_file(file_path: str, parse_json: JSONParser[ResultT]) -> ResultT:
+    """Read and parse the JSON file at `file_path`."""
+    try:
+        # reading a whole file bypasses a BufferedReader's buffer anyway, so
+        # open the raw FileIO and skip creating the BufferedReader at all
+        with open(file_path, "rb", buffering=0) as f:
+            data = f.read()
+    except FileNotFoundError as error:
+        raise PathNotFoundError(str(error)) from error
+    except (OSError, ValueError) as error:
+        # open raises a ValueError rather than an OSError for paths it cannot
+        # represent, such as ones containing a null byte
+        log.debug("Unexpected error reading %s", file_path, exc_info=error)
+        raise FileReadError(str(error)) from error
+
+    try:
+        result = parse_json(data)
+    except Exception as error:
+        # this should only happen if the file being read has been modified
+        # outside of this library or a defective custom JSON encoder was used
+        log.debug("Unexpected error parsing %s", file_path, exc_info=error)
+        raise FileParseError(str(error)) from error
+
+    return result
+
+
+def _iter_json_files(path: PurePosixPath) -> Iterator[Tuple[str, str]]:
+    """Walk a directory tree, yielding `(key, file_path)` for every JSON file."""
+    pending: List[Tuple[str, str]] = [(str(path), "")]
+
+    while pending:
+        dir_path, prefix = pending.pop()
+        subdirs: List[Tuple[str, str]] = []
+
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            continue
+
+        with entries:
+            for entry in entries:
+                name = entry.name
+
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append((entry.path, f"{prefix}{name}/"))
+                elif (
+                    name.endswith(".json")
+                    and not name.startswith(".")
+                    and entry.is_file()
+                ):
+                    yield prefix + name[:-5], entry.path
+
+        # visit subdirectories depth-first, in listing order
+        pending.extend(reversed(subdirs))
+
 
 class SyncFilesystem(SyncFilesystemLike):
     """Synchronous JSON filesystem adapter."""
@@ -37,17 +164,11 @@ class SyncFilesystem(SyncFilesystemLike):
 
     def read_dir(self, path: PurePosixPath) -> List[str]:
         """Get the stem names of all JSON files in the directory."""
-        file_paths = Path(path).glob("**/*.json")
-
-        return [
-            str(file_path.relative_to(path).with_suffix("").as_posix())
-            for file_path in file_paths
-            if not file_path.stem.startswith(".")
-        ]
+        return [key for key, _ in _iter_json_files(path)]
 
     def file_exists(self, path: PurePosixPath) -> bool:
         """Return True if `{path}.json` is a file."""
-        return Path(path.with_suffix(".json")).is_file()
+        return os.path.isfile(_json_path(path))
 
     def read_json(
         self,
@@ -55,26 +176,7 @@ class SyncFilesystem(SyncFilesystemLike):
         parse_json: JSONParser[ResultT] = default_parse_json,
     ) -> ResultT:
         """Read and parse a single JSON file."""
-        file_path = Path(path).with_suffix(".json")
-
-        try:
-            text = file_path.read_text()
-        except FileNotFoundError as error:
-            raise PathNotFoundError(str(error)) from error
-        except Exception as error:
-            # NOTE: this except branch is not covered by tests, but is important
-            log.debug(f"Unexpected error reading {file_path}", exc_info=error)
-            raise FileReadError(str(error)) from error
-
-        try:
-            result = parse_json(text)
-        except Exception as error:
-            # this should only happen if the file being read has been modified
-            # outside of this library or a defective custom JSON encoder was used
-            log.debug(f"Unexpected error parsing {file_path}", exc_info=error)
-            raise FileParseError(str(error)) from error
-
-        return result
+        return _read_json_file(_json_path(path), parse_json)
 
     def read_json_dir(
         self,
@@ -83,23 +185,22 @@ class SyncFilesystem(SyncFilesystemLike):
         ignore_errors: bool = False,
     ) -> List[DirectoryEntry[ResultT]]:
         """Read and parse all JSON files in a directory serially."""
+        entries: List[DirectoryEntry[ResultT]] = []
 
-        def _read_entry(child: str) -> Optional[DirectoryEntry[ResultT]]:
-            child_path = PurePosixPath(path / child)
-
+        # open each file by the path scandir already built while walking the
+        # tree; a PurePosixPath is only needed for each entry that is read
+        for key, file_path in _iter_json_files(path):
             try:
-                child_contents = self.read_json(child_path, parse_json)
-                return DirectoryEntry(path=child_path, contents=child_contents)
+                child_contents = _read_json_file(file_path, parse_json)
             except Exception as error:
                 if not ignore_errors:
                     raise error
 
-                return None
+                continue
 
-        children = self.read_dir(path)
-        entries = [_read_entry(child) for child in children]
+            entries.append(DirectoryEntry(path=path / key, contents=child_contents))
 
-        return [ent for ent in entries if ent is not None]
+        return entries
 
     def write_json(
         self,
@@ -108,35 +209,40 @@ class SyncFilesystem(SyncFilesystemLike):
         encode_json: JSONEncoder[ResultT] = default_encode_json,
     ) -> None:
         """Write an object to a JSON file."""
-        file_path = Path(path.with_suffix(".json"))
+        file_path = _json_path(path)
 
         try:
             encoded_contents = encode_json(contents)
         except Exception as error:
-            log.debug(f"Unexpected error encoding for {file_path}", exc_info=error)
+            log.debug("Unexpected error encoding for %s", file_path, exc_info=error)
             raise FileEncodeError(str(error)) from error
 
         try:
-            self.ensure_dir(path.parent)
-            file_path.write_text(encoded_contents)
+            try:
+                _write_file(file_path, encoded_contents)
+            except FileNotFoundError:
+                # the parent directory usually exists already, so only pay for
+                # mkdir when the first attempt to write fails
+                self.ensure_dir(path.parent)
+                _write_file(file_path, encoded_contents)
         except Exception as error:
             # NOTE: this except branch is not covered by tests, but is important
-            log.debug(f"Unexpected error writing to {file_path}", exc_info=error)
+            log.debug("Unexpected error writing to %s", file_path, exc_info=error)
             raise FileWriteError(str(error)) from error
 
         return None
 
     def remove(self, path: PurePosixPath) -> None:
         """Delete a JSON file."""
-        file_path = Path(path.with_suffix(".json"))
+        file_path = _json_path(path)
 
         try:
-            file_path.unlink()
+            os.unlink(file_path)
         except FileNotFoundError as error:
             raise PathNotFoundError(str(error)) from error
         except Exception as error:
             # NOTE: this except branch is not covered by tests, but is important
-            log.debug(f"Unexpected error reading {file_path}", exc_info=error)
+            log.debug("Unexpected error reading %s", file_path, exc_info=error)
             raise FileRemoveError(str(error)) from error
 
         return None
@@ -1,6 +1,8 @@
 """Read-only store module for junk_drawer."""
 from __future__ import annotations
+from asyncio import gather
 from logging import getLogger
+from operator import itemgetter
 from pathlib import PurePosixPath
 from pydantic import BaseModel
 from typing import (
@@ -41,6 +43,17 @@ Migration = Callable[[Dict[str, Any]], Dict[str, Any]]
 
 log = getLogger(__name__)
 
+# filesystem errors that should be re-raised as item errors, matched against
+# the error's class and then its bases; anything missing from this map (e.g.
+# PathNotFoundError) is treated as a missing item
+_ITEM_ERRORS: Dict[Type[Exception], Type[Exception]] = {
+    FileParseError: ItemDecodeError,
+    FileEncodeError: ItemEncodeError,
+    FileReadError: ItemAccessError,
+    FileWriteError: ItemAccessError,
+    RemoveFileError: ItemAccessError,
+}
+
 
 class ReadStore(Generic[ModelT]):
     """A ReadStore is used to read items in a collection."""
@@ -81,7 +94,10 @@ class ReadStore(Generic[ModelT]):
         """Initialize a Store; use Store.create instead."""
         self._directory = directory
         self._schema = schema
-        self._migrations = migrations
+        self._migrations = tuple(migrations)
+        self._schema_version = len(migrations)
+        self._json_loads = schema.__config__.json_loads
+        self._parse_obj = schema.parse_obj
         self._primary_key = primary_key
         self._filesystem = filesystem
         self._ignore_errors = ignore_errors
@@ -126,6 +142,24 @@ class ReadStore(Generic[ModelT]):
             self._maybe_raise_file_error(error)
             return None
 
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[ModelT]]:
+        """
+        Get several items from the store by key.
+
+        Reads are submitted together rather than awaited one at a time.
+        Returns a list in the same order as `keys`, with `None` for any key
+        that does not exist.
+        """
+        return list(await gather(*(self.get(key) for key in keys)))
+
+    def get_many_sync(self, keys: Sequence[str]) -> List[Optional[ModelT]]:
+        """
+        Get several items from the store by key.
+
+        Synchronous version of :py:meth:`get_many`.
+        """
+        return [self.get_sync(key) for key in keys]
+
     async def get_all_keys(self) -> List[str]:
         """Get all keys in the store."""
         return await self._filesystem.read_dir(self._directory)
@@ -171,7 +205,7 @@ class ReadStore(Generic[ModelT]):
     async def get_all_items(self) -> List[ModelT]:
         """Get all items in the store."""
         entries = await self.get_all_entries()
-        return [item for key, item in entries]
+        return list(map(itemgetter(1), entries))
 
     def get_all_items_sync(self) -> List[ModelT]:
         """
@@ -180,20 +214,26 @@ class ReadStore(Generic[ModelT]):
         Synchronous version of :py:meth:`get_all_items`.
         """
         entries = self.get_all_entries_sync()
-        return [item for key, item in entries]
-
-    def parse_json(self, data: str) -> ModelT:
-        """Decode a string into a model instance."""
-        obj = self._schema.__config__.json_loads(data)
+        return list(map(itemgetter(1), entries))
+
+    def parse_json(self, data: Union[str, bytes]) -> ModelT:
+        """Decode a JSON string or UTF-8 encoded bytes into a model instance."""
+        # pydantic's `Config.json_loads` is typed to accept a `str`; decode bytes
+        # the same way `BaseModel.parse_raw` would before handing them off
+        text = data.decode() if isinstance(data, bytes) else data
+        obj = self._json_loads(text)
         schema_version = obj.pop(SCHEMA_VERSION_KEY, 0)
 
-        for migrate in self._migrations[schema_version:]:
-            obj = migrate(obj)
+        # skip slicing the migrations list for data that is already up to date
+        if schema_version < self._schema_version:
+            for migrate in self._migrations[schema_version:]:
+                obj = migrate(obj)
 
-        return self._schema.parse_obj(obj)
+        return self._parse_obj(obj)
 
     def _get_key_path(self, key: str) -> PurePosixPath:
-        return PurePosixPath(self._directory / key)
+        # `/` on a PurePosixPath already returns a PurePosixPath
+        return self._directory / key
 
     def _get_item_key(self, item: ModelT, key: Optional[str]) -> str:
         item_key = (
@@ -208,9 +248,8 @@ class ReadStore(Generic[ModelT]):
 
     def _maybe_raise_file_error(self, error: FileError) -> None:
         if not self._ignore_errors:
-            if isinstance(error, FileParseError):
-                raise ItemDecodeError(str(error))
-            elif isinstance(error, FileEncodeError):
-                raise ItemEncodeError(str(error))
-            elif isinstance(error, (FileReadError, FileWriteError, RemoveFileError)):
-                raise ItemAccessError(str(error))
+            for error_type in type(error).__mro__:
+                item_error = _ITEM_ERRORS.get(error_type)
+
+                if item_error is not None:
+                    raise item_error(str(error))
@@ -1,7 +1,8 @@
 """Store module for junk_drawer."""
 from __future__ import annotations
+from asyncio import gather
 from logging import getLogger
-from typing import Optional
+from typing import List, Optional, Sequence
 
 from .read_store import SCHEMA_VERSION_KEY, ReadStore, ModelT
 
@@ -55,6 +56,35 @@ class Store(ReadStore[ModelT]):
             self._maybe_raise_file_error(error)
             return None
 
+    async def put_many(
+        self, items: Sequence[ModelT], keys: Optional[Sequence[str]] = None
+    ) -> List[Optional[str]]:
+        """
+        Put several items to the store.
+
+        Writes are submitted together rather than awaited one at a time. If
+        `keys` is omitted, each item's `primary_key` is used. Returns a list of
+        keys in the same order as `items`, as :py:meth:`put` would. Raises a
+        ValueError if `keys` and `items` are not the same length.
+        """
+        item_keys = self._get_many_keys(items, keys)
+
+        return list(
+            await gather(*(self.put(it, key) for it, key in zip(items, item_keys)))
+        )
+
+    def put_many_sync(
+        self, items: Sequence[ModelT], keys: Optional[Sequence[str]] = None
+    ) -> List[Optional[str]]:
+        """
+        Put several items to the store.
+
+        Synchronous version of :py:meth:`put_many`.
+        """
+        item_keys = self._get_many_keys(items, keys)
+
+        return [self.put_sync(it, key) for it, key in zip(items, item_keys)]
+
     async def ensure(self, default_item: ModelT, key: Optional[str] = None) -> ModelT:
         """
         Ensure an item exists in the store at the given key.
@@ -134,23 +164,24 @@ class Store(ReadStore[ModelT]):
         """
         return self._filesystem.sync.remove_dir(self._directory)
 
+    def _get_many_keys(
+        self, items: Sequence[ModelT], keys: Optional[Sequence[str]]
+    ) -> Sequence[Optional[str]]:
+        if keys is None:
+            return [None] * len(items)
+
+        if len(keys) != len(items):
+            raise ValueError("keys and items must be the same length")
+
+        return keys
+
     def encode_json(self, item: ModelT) -> str:
         """Encode a model instance into JSON."""
         obj = item.dict()
-        obj[SCHEMA_VERSION_KEY] = len(self._migrations)
+        obj[SCHEMA_VERSION_KEY] = self._schema_version
 
         # NOTE(mc, 2020-10-25): __json_encoder__ is an undocumented property
         # of BaseModel, but its usage here is to ensure Pydantic model config
         # related to serialization is properly used. This functionality is
         # covered by basic integration tests
         return item.__config__.json_dumps(obj, default=item.__json_encoder__)
-
-    def parse_json(self, data: str) -> ModelT:
-        """Decode a string into a model instance."""
-        obj = self._schema.__config__.json_loads(data)
-        schema_version = obj.pop(SCHEMA_VERSION_KEY, 0)
-
-        for migrate in self._migrations[schema_version:]:
-            obj = migrate(obj)
-
-        return self._schema.parse_obj(obj)
@@ -18,13 +18,14 @@ def mock_filesystem() -> AsyncMock:
     return AsyncMock(spec=AsyncFilesystem)
 
 
-@pytest.fixture
+# the real filesystem adapters are stateless, so one instance can be shared
+@pytest.fixture(scope="session")
 def sync_filesystem() -> SyncFilesystem:
     """Create a real synchronous filesystem."""
     return SyncFilesystem()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def filesystem(sync_filesystem: SyncFilesystem) -> AsyncFilesystem:
     """Create a real asynchronous filesystem."""
     return AsyncFilesystem(sync_filesystem=sync_filesystem)
@@ -1,11 +1,22 @@
 """Integration tests for AsyncFilesystem read operations."""
 import pytest
+from asyncio import sleep
+from concurrent.futures import Future, ThreadPoolExecutor
 from mock import MagicMock
 from pathlib import Path, PurePosixPath
-from typing import Any, Dict, List
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    TypeVar,
+)
 
 from junk_drawer.filesystem import (
     AsyncFilesystem,
+    SyncFilesystem,
     DirectoryEntry as Entry,
     PathNotFoundError,
     FileParseError,
@@ -15,6 +26,8 @@ pytestmark = pytest.mark.asyncio
 
 ParsedObj = Dict[str, Any]
 
+T = TypeVar("T")
+
 
 async def test_ensure_dir_noops_when_dir_exists(
     tmp_path: Path, filesystem: AsyncFilesystem
@@ -190,6 +203,115 @@ async def test_read_json_dir_can_ignore_errors(
     assert files == [Entry(path=path / "foo", contents={"foo": "hello", "bar": 0})]
 
 
+async def test_iter_json_dir_yields_each_file(
+    tmp_path: Path, filesystem: AsyncFilesystem
+) -> None:
+    """It should yield an entry for every file in a directory."""
+    Path(tmp_path / "some-dir").mkdir()
+    Path(tmp_path / "some-dir" / "foo.json").write_text(
+        """{ "foo": "hello", "bar": 0 }"""
+    )
+    Path(tmp_path / "bar.json").write_text("""{ "foo": "from the", "bar": 1 }""")
+
+    path = PurePosixPath(tmp_path)
+    entries: AsyncIterator[Entry[ParsedObj]] = filesystem.iter_json_dir(path)
+    files = [entry async for entry in entries]
+
+    assert len(files) == 2
+    assert (
+        Entry(path=path / "some-dir" / "foo", contents={"foo": "hello", "bar": 0})
+        in files
+    )
+    assert Entry(path=path / "bar", contents={"foo": "from the", "bar": 1}) in files
+
+
+async def test_iter_json_dir_raises_parse_error(
+    tmp_path: Path, filesystem: AsyncFilesystem
+) -> None:
+    """It should raise a FileParseError if a file is not valid JSON."""
+    Path(tmp_path / "bar.json").write_text("""{ "foo": "from the",}""")
+
+    path = PurePosixPath(tmp_path)
+    entries: AsyncIterator[Entry[ParsedObj]] = filesystem.iter_json_dir(path)
+
+    with pytest.raises(FileParseError):
+        [entry async for entry in entries]
+
+
+async def test_iter_json_dir_can_ignore_errors(
+    tmp_path: Path, filesystem: AsyncFilesystem
+) -> None:
+    """It should allow iterating directory files while ignoring any errors."""
+    Path(tmp_path / "foo.json").write_text("""{ "foo": "hello", "bar": 0 }""")
+    Path(tmp_path / "bar.json").write_text("""{ "foo": "from the",}""")
+
+    path = PurePosixPath(tmp_path)
+    entries: AsyncIterator[Entry[ParsedObj]] = filesystem.iter_json_dir(
+        path, ignore_errors=True
+    )
+    files = [entry async for entry in entries]
+
+    assert files == [Entry(path=path / "foo", contents={"foo": "hello", "bar": 0})]
+
+
+async def test_iter_json_dir_matches_read_json_dir_for_dotted_names(
+    tmp_path: Path, filesystem: AsyncFilesystem
+) -> None:
+    """It should yield the same entries as read_json_dir for dotted file names."""
+    Path(tmp_path / "v1.2.json").write_text("""{ "foo": "hello", "bar": 0 }""")
+
+    path = PurePosixPath(tmp_path)
+    entries: AsyncIterator[Entry[ParsedObj]] = filesystem.iter_json_dir(path)
+    files = [entry async for entry in entries]
+    expected: List[Entry[ParsedObj]] = await filesystem.read_json_dir(path)
+
+    assert files == expected
+    assert files == [Entry(path=path / "v1.2", contents={"foo": "hello", "bar": 0})]
+
+
+class _HoldingExecutor(ThreadPoolExecutor):
+    """A thread pool that runs its first `limit` tasks and holds the rest."""
+
+    def __init__(self, limit: int) -> None:
+        super().__init__(max_workers=1)
+        self.limit = limit
+        self.held: List["Future[Any]"] = []
+
+    def submit(self, __fn: Callable[..., T], *args: Any, **kwargs: Any) -> Future[T]:
+        if self.limit > 0:
+            self.limit -= 1
+            return super().submit(__fn, *args, **kwargs)
+
+        future: Future[T] = Future()
+        self.held.append(future)
+        return future
+
+
+async def test_iter_json_dir_cancels_prefetch_on_close(
+    tmp_path: Path, sync_filesystem: SyncFilesystem
+) -> None:
+    """It should cancel the prefetched read if the consumer stops early."""
+    Path(tmp_path / "foo.json").write_text("""{ "foo": "hello", "bar": 0 }""")
+    Path(tmp_path / "bar.json").write_text("""{ "foo": "from the", "bar": 1 }""")
+
+    # run the directory listing and the first read, holding back the prefetch
+    executor = _HoldingExecutor(limit=2)
+    filesystem = AsyncFilesystem(sync_filesystem=sync_filesystem, executor=executor)
+    entries: AsyncGenerator[Entry[ParsedObj], None] = filesystem.iter_json_dir(
+        PurePosixPath(tmp_path)
+    )
+
+    try:
+        await entries.__anext__()
+        await entries.aclose()
+        await sleep(0)
+    finally:
+        executor.shutdown()
+
+    assert len(executor.held) == 1
+    assert executor.held[0].cancelled() is True
+
+
 async def test_read_json_with_custom_parser(
     tmp_path: Path, mock_parse_json: MagicMock, filesystem: AsyncFilesystem
 ) -> None:
@@ -201,7 +323,7 @@ async def test_read_json_with_custom_parser(
     result = await filesystem.read_json(path, parse_json=mock_parse_json)
 
     assert result == {"call me": "maybe"}
-    mock_parse_json.assert_called_with("""{ "this": "is crazy" }""")
+    mock_parse_json.assert_called_with(b"""{ "this": "is crazy" }""")
 
 
 async def test_read_json_when_custom_parser_raises(
@@ -234,6 +356,6 @@ async def test_read_json_dir_with_custom_parser(
     assert Entry(path=path / "foo", contents={"call me": "maybe"}) in files
     assert Entry(path=path / "bar", contents={"call me": "maybe"}) in files
     assert Entry(path=path / "baz", contents={"call me": "maybe"}) in files
-    mock_parse_json.assert_any_call("""{ "foo": "hello", "bar": 0 }""")
-    mock_parse_json.assert_any_call("""{ "foo": "from the", "bar": 1 }""")
-    mock_parse_json.assert_any_call("""{ "foo": "other side", "bar": 2 }""")
+    mock_parse_json.assert_any_call(b"""{ "foo": "hello", "bar": 0 }""")
+    mock_parse_json.assert_any_call(b"""{ "foo": "from the", "bar": 1 }""")
+    mock_parse_json.assert_any_call(b"""{ "foo": "other side", "bar": 2 }""")
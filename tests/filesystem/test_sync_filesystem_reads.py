@@ -8,6 +8,7 @@ from junk_drawer.filesystem import (
     SyncFilesystem,
     DirectoryEntry as Entry,
     PathNotFoundError,
+    FileReadError,
     FileParseError,
 )
 
@@ -45,6 +46,15 @@ def test_read_dir_with_empty_dir(
     assert basenames == []
 
 
+def test_read_dir_with_nonexistent_dir(
+    tmp_path: Path, sync_filesystem: SyncFilesystem
+) -> None:
+    """It should return an empty list with read_dir on a missing directory."""
+    basenames = sync_filesystem.read_dir(PurePosixPath(tmp_path / "nope"))
+
+    assert basenames == []
+
+
 def test_read_dir_with_dir_of_json_files(
     tmp_path: Path, sync_filesystem: SyncFilesystem
 ) -> None:
@@ -64,6 +74,18 @@ def test_read_dir_ignores_non_json_and_dotfiles(
     (tmp_path / "foo.json").touch()
     (tmp_path / ".bar.json").touch()
     (tmp_path / "baz.zip").touch()
+    (tmp_path / "qux.json.bak").touch()
+    basenames = sync_filesystem.read_dir(tmp_path)
+
+    assert basenames == ["foo"]
+
+
+def test_read_dir_ignores_broken_links(
+    tmp_path: Path, sync_filesystem: SyncFilesystem
+) -> None:
+    """It should ignore JSON names that do not point to a file with read_dir."""
+    (tmp_path / "foo.json").touch()
+    (tmp_path / "bar.json").symlink_to(tmp_path / "nope.json")
     basenames = sync_filesystem.read_dir(tmp_path)
 
     assert basenames == ["foo"]
@@ -135,6 +157,16 @@ def test_read_json_raises_path_does_not_exist_error(
         sync_filesystem.read_json(path)
 
 
+def test_read_json_raises_read_error_for_invalid_path(
+    tmp_path: Path, sync_filesystem: SyncFilesystem
+) -> None:
+    """It should raise a FileReadError if the path cannot be opened."""
+    path = PurePosixPath(tmp_path / "foo\0bar")
+
+    with pytest.raises(FileReadError, match="null"):
+        sync_filesystem.read_json(path)
+
+
 def test_read_json_raises_parse_error(
     tmp_path: Path, sync_filesystem: SyncFilesystem
 ) -> None:
@@ -211,7 +243,7 @@ def test_read_json_with_custom_parser(
     result = sync_filesystem.read_json(path, parse_json=mock_parse_json)
 
     assert result == {"call me": "maybe"}
-    mock_parse_json.assert_called_with("""{ "this": "is crazy" }""")
+    mock_parse_json.assert_called_with(b"""{ "this": "is crazy" }""")
 
 
 def test_read_json_when_custom_parser_raises(
@@ -244,6 +276,6 @@ def test_read_json_dir_with_custom_parser(
     assert Entry(path=path / "foo", contents={"call me": "maybe"}) in files
     assert Entry(path=path / "bar", contents={"call me": "maybe"}) in files
     assert Entry(path=path / "baz", contents={"call me": "maybe"}) in files
-    mock_parse_json.assert_any_call("""{ "foo": "hello", "bar": 0 }""")
-    mock_parse_json.assert_any_call("""{ "foo": "from the", "bar": 1 }""")
-    mock_parse_json.assert_any_call("""{ "foo": "other side", "bar": 2 }""")
+    mock_parse_json.assert_any_call(b"""{ "foo": "hello", "bar": 0 }""")
+    mock_parse_json.assert_any_call(b"""{ "foo": "from the", "bar": 1 }""")
+    mock_parse_json.assert_any_call(b"""{ "foo": "other side", "bar": 2 }""")
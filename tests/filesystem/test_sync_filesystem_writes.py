@@ -1,7 +1,9 @@
 """Integration tests for AsyncFilesystem read operations."""
+import os
 import pytest
+import stat
 from mock import MagicMock
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from junk_drawer.filesystem import SyncFilesystem, PathNotFoundError, FileEncodeError
 
 
@@ -72,6 +74,57 @@ def test_write_json_creates_dirs_if_necessary(
     assert path.with_suffix(".json").read_text() == """{"foo": "hello", "bar": 0}"""
 
 
+def test_write_json_recreates_removed_dirs(
+    tmp_path: Path, sync_filesystem: SyncFilesystem
+) -> None:
+    """It should recreate directories that were removed after a write."""
+    path = tmp_path / "foo" / "bar"
+    sync_filesystem.write_json(path, {"foo": "hello", "bar": 0})
+    sync_filesystem.remove_dir(tmp_path / "foo")
+    sync_filesystem.write_json(path, {"foo": "hello", "bar": 1})
+
+    assert path.with_suffix(".json").read_text() == """{"foo": "hello", "bar": 1}"""
+
+
+def test_write_json_replaces_existing_file(
+    tmp_path: Path, sync_filesystem: SyncFilesystem
+) -> None:
+    """It should overwrite an existing file without leaving temporary files."""
+    path = tmp_path / "foo"
+    path.with_suffix(".json").write_text("""{"foo": "a much longer old value"}""")
+
+    sync_filesystem.write_json(path, {"foo": "hello", "bar": 0})
+
+    assert path.with_suffix(".json").read_text() == """{"foo": "hello", "bar": 0}"""
+    assert [p.name for p in tmp_path.iterdir()] == ["foo.json"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Windows only has a read-only mode bit")
+def test_write_json_keeps_existing_file_mode(
+    tmp_path: Path, sync_filesystem: SyncFilesystem
+) -> None:
+    """It should keep the permissions of a file it replaces."""
+    path = PurePosixPath(tmp_path / "foo")
+    (tmp_path / "foo.json").write_text("{}")
+    (tmp_path / "foo.json").chmod(0o640)
+
+    sync_filesystem.write_json(path, {"foo": "hello", "bar": 0})
+
+    assert stat.S_IMODE((tmp_path / "foo.json").stat().st_mode) == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == ["foo.json"]
+
+
+def test_write_json_replaces_suffix_in_file_name(
+    tmp_path: Path, sync_filesystem: SyncFilesystem
+) -> None:
+    """It should replace an existing suffix with .json."""
+    path = tmp_path / "foo.bar"
+    sync_filesystem.write_json(path, {"foo": "hello", "bar": 0})
+
+    assert (tmp_path / "foo.json").read_text() == """{"foo": "hello", "bar": 0}"""
+    assert sync_filesystem.read_dir(tmp_path) == ["foo"]
+
+
 def test_write_json_raises_encode_error(
     tmp_path: Path, sync_filesystem: SyncFilesystem
 ) -> None:
@@ -96,6 +149,20 @@ def test_write_json_with_custom_encoder(
     mock_encode_json.assert_called_with(obj)
 
 
+def test_write_json_with_custom_bytes_encoder(
+    tmp_path: Path, mock_encode_json: MagicMock, sync_filesystem: SyncFilesystem
+) -> None:
+    """It should write bytes returned by a custom encoder as-is."""
+    path = tmp_path / "foo"
+    obj = {"foo": "hello", "bar": 0}
+    mock_encode_json.return_value = b"call me maybe\n"
+
+    sync_filesystem.write_json(path, obj, encode_json=mock_encode_json)
+
+    assert path.with_suffix(".json").read_bytes() == b"call me maybe\n"
+    mock_encode_json.assert_called_with(obj)
+
+
 def test_write_json_when_custom_encoder_raises(
     tmp_path: Path, mock_encode_json: MagicMock, sync_filesystem: SyncFilesystem
 ) -> None:
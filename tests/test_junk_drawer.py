@@ -3,6 +3,7 @@ import pytest
 from pathlib import Path, PurePosixPath
 from pydantic import BaseModel
 from junk_drawer import Store
+from junk_drawer.errors import ItemAccessError
 from typing import Optional
 
 pytestmark = pytest.mark.asyncio
@@ -164,3 +165,27 @@ async def test_store_write_and_read_with_nested_keys(
 
     assert result == CoolModel(foo="hello", bar="world")
     assert Path(real_store_path / "foo" / "bar" / "baz.json").exists()
+
+
+def test_store_dotted_keys_lose_their_suffix(real_store_path: PurePosixPath) -> None:
+    """A key's last suffix should be replaced by .json, as in existing stores."""
+    store = Store.create(real_store_path, schema=CoolModel)
+    item = CoolModel(foo="hello", bar="world")
+
+    key = store.put_sync(item, "user@example.com")
+
+    # the file name drops ".com", so listing the store returns a different key
+    assert key == "user@example.com"
+
+    assert Path(real_store_path / "user@example.json").exists()
+    assert store.get_sync("user@example.com") == item
+    assert store.get_all_keys_sync() == ["user@example"]
+    assert store.get_all_entries_sync() == [("user@example", item)]
+
+
+def test_store_get_with_invalid_key(real_store_path: PurePosixPath) -> None:
+    """A key that cannot be opened as a file should raise an ItemAccessError."""
+    store = Store.create(real_store_path, schema=CoolModel)
+
+    with pytest.raises(ItemAccessError, match="null"):
+        store.get_sync("a\0b")
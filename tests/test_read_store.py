@@ -142,6 +142,40 @@ def test_store_get_sync_returns_read_result_from_deep_key(
     )
 
 
+async def test_store_get_many(
+    store: ReadStore[CoolModel], store_path: PurePosixPath, mock_filesystem: AsyncMock
+) -> None:
+    """It should return items from store.get_many in key order."""
+    result = CoolModel(foo="bar", bar=42)
+    mock_filesystem.read_json.side_effect = [result, PathNotFoundError()]
+    items = await store.get_many(["foo", "bar"])
+
+    assert items == [result, None]
+    mock_filesystem.read_json.assert_any_call(
+        store_path / "foo", parse_json=store.parse_json
+    )
+    mock_filesystem.read_json.assert_any_call(
+        store_path / "bar", parse_json=store.parse_json
+    )
+
+
+def test_store_get_many_sync(
+    store: ReadStore[CoolModel], store_path: PurePosixPath, mock_filesystem: AsyncMock
+) -> None:
+    """It should return items from store.get_many_sync in key order."""
+    result = CoolModel(foo="bar", bar=42)
+    mock_filesystem.sync.read_json.side_effect = [result, PathNotFoundError()]
+    items = store.get_many_sync(["foo", "bar"])
+
+    assert items == [result, None]
+    mock_filesystem.sync.read_json.assert_any_call(
+        store_path / "foo", parse_json=store.parse_json
+    )
+    mock_filesystem.sync.read_json.assert_any_call(
+        store_path / "bar", parse_json=store.parse_json
+    )
+
+
 async def test_store_get_all_keys_reads_dir(
     store: ReadStore[CoolModel], store_path: PurePosixPath, mock_filesystem: AsyncMock
 ) -> None:
@@ -249,19 +283,37 @@ async def test_store_get_raises_invalid_json(
     mock_filesystem.sync.read_json.side_effect = FileParseError("oh no")
     mock_filesystem.sync.read_json_dir.side_effect = FileParseError("oh no")
 
-    with pytest.raises(ItemDecodeError, match=r".*oh no.*"):
+    with pytest.raises(ItemDecodeError, match="oh no"):
         await store.get("foo")
 
-    with pytest.raises(ItemDecodeError, match=r".*oh no.*"):
+    with pytest.raises(ItemDecodeError, match="oh no"):
         store.get_sync("foo")
 
-    with pytest.raises(ItemDecodeError, match=r".*oh no.*"):
+    with pytest.raises(ItemDecodeError, match="oh no"):
         await store.get_all_items()
 
-    with pytest.raises(ItemDecodeError, match=r".*oh no.*"):
+    with pytest.raises(ItemDecodeError, match="oh no"):
         store.get_all_items_sync()
 
 
+async def test_store_get_raises_for_file_error_subclass(
+    store: ReadStore[CoolModel], mock_filesystem: AsyncMock
+) -> None:
+    """It should map subclasses of filesystem errors to the parent's item error."""
+
+    class MyParseError(FileParseError):
+        pass
+
+    mock_filesystem.read_json.side_effect = MyParseError("oh no")
+    mock_filesystem.sync.read_json.side_effect = MyParseError("oh no")
+
+    with pytest.raises(ItemDecodeError, match="oh no"):
+        await store.get("foo")
+
+    with pytest.raises(ItemDecodeError, match="oh no"):
+        store.get_sync("foo")
+
+
 async def test_store_get_raises_read_error(
     store: ReadStore[CoolModel], mock_filesystem: AsyncMock
 ) -> None:
@@ -271,16 +323,16 @@ async def test_store_get_raises_read_error(
     mock_filesystem.sync.read_json.side_effect = FileReadError("oh no")
     mock_filesystem.sync.read_json_dir.side_effect = FileReadError("oh no")
 
-    with pytest.raises(ItemAccessError, match=r".*oh no.*"):
+    with pytest.raises(ItemAccessError, match="oh no"):
         await store.get("foo")
 
-    with pytest.raises(ItemAccessError, match=r".*oh no.*"):
+    with pytest.raises(ItemAccessError, match="oh no"):
         store.get_sync("foo")
 
-    with pytest.raises(ItemAccessError, match=r".*oh no.*"):
+    with pytest.raises(ItemAccessError, match="oh no"):
         await store.get_all_items()
 
-    with pytest.raises(ItemAccessError, match=r".*oh no.*"):
+    with pytest.raises(ItemAccessError, match="oh no"):
         store.get_all_items_sync()
 
 
@@ -83,6 +83,14 @@ def test_parse_json(store: Store[CoolModel]) -> None:
     assert result == CoolModel(foo="hello", bar=42)
 
 
+def test_parse_json_bytes(store: Store[CoolModel]) -> None:
+    """It should parse UTF-8 encoded JSON bytes into a Pydantic model."""
+    data = b'{"foo": "hello", "bar": 42, "__schema_version__": 0}'
+    result = store.parse_json(data)
+
+    assert result == CoolModel(foo="hello", bar=42)
+
+
 def test_parse_json_strict(strict_store: Store[StrictModel]) -> None:
     """It should parse a JSON string into a model with extra: forbid."""
     data = '{"foo": "hello", "bar": 42, "__schema_version__": 0}'
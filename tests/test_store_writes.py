@@ -205,6 +205,60 @@ def test_store_put_sync_with_primary_key(
     )
 
 
+async def test_store_put_many(
+    store: Store[CoolModel], store_path: PurePosixPath, mock_filesystem: AsyncMock
+) -> None:
+    """store.put_many should call filesystem.write_json for each item."""
+    items = [CoolModel(foo="hello", bar=0), CoolModel(foo="world", bar=1)]
+    added_keys = await store.put_many(items, ["key-0", "key-1"])
+
+    assert added_keys == ["key-0", "key-1"]
+    mock_filesystem.write_json.assert_any_call(
+        store_path / "key-0", items[0], encode_json=store.encode_json
+    )
+    mock_filesystem.write_json.assert_any_call(
+        store_path / "key-1", items[1], encode_json=store.encode_json
+    )
+
+
+def test_store_put_many_sync(
+    store: Store[CoolModel], store_path: PurePosixPath, mock_filesystem: AsyncMock
+) -> None:
+    """store.put_many_sync should call filesystem.write_json for each item."""
+    items = [CoolModel(foo="hello", bar=0), CoolModel(foo="world", bar=1)]
+    added_keys = store.put_many_sync(items, ["key-0", "key-1"])
+
+    assert added_keys == ["key-0", "key-1"]
+    mock_filesystem.sync.write_json.assert_any_call(
+        store_path / "key-0", items[0], encode_json=store.encode_json
+    )
+    mock_filesystem.sync.write_json.assert_any_call(
+        store_path / "key-1", items[1], encode_json=store.encode_json
+    )
+
+
+async def test_store_put_many_with_primary_key(
+    keyed_store: Store[CoolModel], mock_filesystem: AsyncMock
+) -> None:
+    """store.put_many should pull primary keys from the models if available."""
+    items = [CoolModel(foo="hello", bar=0), CoolModel(foo="world", bar=1)]
+    added_keys = await keyed_store.put_many(items)
+
+    assert added_keys == ["hello", "world"]
+
+
+def test_store_put_many_sync_mismatched_keys_raises(
+    store: Store[CoolModel], mock_filesystem: AsyncMock
+) -> None:
+    """store.put_many_sync should raise if keys and items do not line up."""
+    items = [CoolModel(foo="hello", bar=0), CoolModel(foo="world", bar=1)]
+
+    with pytest.raises(ValueError, match="same length"):
+        store.put_many_sync(items, ["key-0"])
+
+    mock_filesystem.sync.write_json.assert_not_called()
+
+
 async def test_store_put_with_non_string_primary_key(
     keyed_store: Store[CoolModel], mock_filesystem: AsyncMock
 ) -> None: